@@ -6,6 +6,7 @@ try:
     import polyinterface
 except ImportError:
     import pgc_interface as polyinterface
+import time
 
 
 LOGGER = polyinterface.LOGGER
@@ -33,9 +34,9 @@ def update_driver(self, driver, value, force=False, prec=3):
         if value == None or value == "None":
             value = "0"
         self.setDriver(driver, round(float(value), prec), True, force, self.uom[driver])
-        LOGGER.debug('setDriver (%s, %f)' %(driver, float(value)))
+        LOGGER.debug('setDriver (%s, %s)', driver, value)
     except:
-        LOGGER.warning('Missing data for driver ' + driver)
+        LOGGER.warning('Missing data for driver %s', driver)
 
 def get_saved_log_level(self):
     if 'customData' in self.polyConfig:
@@ -70,6 +71,59 @@ def set_logging_level(self, level=None):
 
 functions = (update_driver, get_saved_log_level, save_log_level, set_logging_level)
 
+"""
+    Rate limited / sampled logging for messages that would otherwise be
+    logged on every poll.
+
+    Each message is identified by a key.  A message is only logged if
+    it is the Nth occurrence of that key (sample) and at least interval
+    seconds have passed since that key was last logged.  The number of
+    messages skipped in between is appended to the next one logged.
+    Call reset() once the condition clears so the next occurrence is
+    logged right away.
+
+    Nothing is counted or formatted if the logger isn't enabled for
+    the requested level.
+
+    usage:
+       self.log_limit = LogLimiter(interval=600)
+       self.log_limit.log(logging.INFO, 'summary', 'AQI for %s is %d', name, aqi)
+"""
+
+class LogLimiter:
+    def __init__(self, interval=0, sample=1):
+        self.interval = interval
+        self.sample = max(int(sample), 1)
+        self.seen = {}
+        self.last = {}
+        self.suppressed = {}
+
+    def log(self, level, key, msg, *args):
+        if not LOGGER.isEnabledFor(level):
+            return
+
+        now = time.time()
+        count = self.seen.get(key, 0)
+        self.seen[key] = count + 1
+
+        if count % self.sample != 0 or \
+                (key in self.last and now - self.last[key] < self.interval):
+            self.suppressed[key] = self.suppressed.get(key, 0) + 1
+            return
+
+        self.last[key] = now
+        skipped = self.suppressed.pop(key, 0)
+        if skipped:
+            LOGGER.log(level, msg + ' (%d similar messages suppressed)', *args, skipped)
+        else:
+            LOGGER.log(level, msg, *args)
+
+    # Forget the history for key so the next message is logged
+    def reset(self, key):
+        self.seen.pop(key, None)
+        self.last.pop(key, None)
+        self.suppressed.pop(key, None)
+
 """
     Functions to handle custom parameters.
 
@@ -164,9 +218,9 @@ class NSParameters:
         params = {}
 
         for p in self.internal:
-            LOGGER.debug('checking for ' + p['name'] + ' in customParams')
+            LOGGER.debug('checking for %s in customParams', p['name'])
             if p['name'] in customParams:
-                LOGGER.debug('found ' + p['name'] + ' in customParams')
+                LOGGER.debug('found %s in customParams', p['name'])
                 val = customParams[p['name']]
 
                 if val != p['value']:
@@ -177,7 +231,7 @@ class NSParameters:
                 p['value'] = val
 
                 if p['value'] != p['default']:
-                    LOGGER.debug(p['name'] + ' is now set')
+                    LOGGER.debug('%s is now set', p['name'])
                     p['isSet'] = True
             
             if p['isSet']:
@@ -22,6 +22,9 @@ from datetime import timedelta
 
 LOGGER = polyinterface.LOGGER
 
+# File written by the DUMP_RAW command
+RAW_DUMP_FILE = 'raw_responses.json'
+
 @node_funcs.add_functions_as_methods(node_funcs.functions)
 class Controller(polyinterface.Controller):
     id = 'controller'
@@ -52,7 +55,7 @@ class Controller(polyinterface.Controller):
                 if sensor_name == 'APIKey':
                     self.apikey = self.polyConfig['customParams']['APIKey']
                 elif sensor_name not in self.sensor_list:
-                    LOGGER.info('Found Purple Air sensor ID ' + sensor_name + ' with ID ' + self.polyConfig['customParams'][sensor_name])
+                    LOGGER.info('Found Purple Air sensor ID %s with ID %s', sensor_name, self.polyConfig['customParams'][sensor_name])
                     sensor_id = self.polyConfig['customParams'][sensor_name]
                     self.sensor_list[sensor_name] = {'id': sensor_id, 'configured': False}
                     rediscover = True
@@ -93,19 +96,19 @@ class Controller(polyinterface.Controller):
         self.in_discover = True
         LOGGER.info("In Discovery...")
         for sensor_name in self.sensor_list:
-            LOGGER.debug(self.sensor_list[sensor_name])
+            LOGGER.debug('%s: %s', sensor_name, self.sensor_list[sensor_name])
             if self.sensor_list[sensor_name]['configured']:
-                LOGGER.info('Sensor ' + sensor_name + ' already configured, skipping.')
+                LOGGER.debug('Sensor %s already configured, skipping.', sensor_name)
                 continue
 
             try:
                 node = sensor.SensorNode(self, self.address, self.sensor_list[sensor_name]['id'], sensor_name)
                 node.configure(self.sensor_list[sensor_name]['id'], self.apikey)
-                LOGGER.info('Adding new node for ' + sensor_name)
+                LOGGER.info('Adding new node for %s', sensor_name)
                 self.addNode(node)
                 self.sensor_list[sensor_name]['configured'] = True
             except Exception as e:
-                LOGGER.error(str(e))
+                LOGGER.error('Failed to add node for %s: %s', sensor_name, e)
 
         self.in_discover = False
 
@@ -121,13 +124,28 @@ class Controller(polyinterface.Controller):
         st = self.poly.installprofile()
         return st
 
+    # Write the buffered raw responses for all sensors to a file so
+    # they can be inspected without leaving debug logging enabled.
+    def dump_raw(self, command=None):
+        try:
+            raw = {}
+            for node in list(self.nodes):
+                if self.nodes[node].address != self.address:
+                    raw[self.nodes[node].name] = self.nodes[node].dump_raw()
+
+            with open(RAW_DUMP_FILE, 'w') as f:
+                json.dump(raw, f, indent=2, default=str)
+            LOGGER.warning('Raw responses for %d sensors written to %s', len(raw), RAW_DUMP_FILE)
+        except Exception as e:
+            LOGGER.error('Failed to write raw responses: %s', e)
+
     def check_params(self):
         if 'customParams' in self.polyConfig:
             for sensor_name in self.polyConfig['customParams']:
                 if sensor_name == 'APIKey':
                     self.apikey = self.polyConfig['customParams']['APIKey']
                 elif sensor_name not in self.sensor_list:
-                    LOGGER.info('Found Purple Air sensor ID ' + sensor_name + ' with ID ' + self.polyConfig['customParams'][sensor_name])
+                    LOGGER.info('Found Purple Air sensor ID %s with ID %s', sensor_name, self.polyConfig['customParams'][sensor_name])
                     sensor_id = self.polyConfig['customParams'][sensor_name]
                     self.sensor_list[sensor_name] = {'id': sensor_id, 'configured': False}
         else:
@@ -162,6 +180,7 @@ class Controller(polyinterface.Controller):
             'UPDATE_PROFILE': update_profile,
             'REMOVE_NOTICES_ALL': remove_notices_all,
             'DEBUG': set_logging_level,
+            'DUMP_RAW': dump_raw,
             }
 
     # For this node server, all of the info is available in the single
@@ -11,10 +11,22 @@ except ImportError:
 
 import requests
 import json
+import time
+import logging
+import collections
 import node_funcs
 
 LOGGER = polyinterface.LOGGER
 
+# Number of raw responses kept for each sensor (see dump_raw)
+RAW_HISTORY = 20
+
+# Minimum number of seconds between the per-sensor summary log lines
+SUMMARY_INTERVAL = 600
+
+# Only every Nth occurrence of a repeating poll error is logged
+ERROR_SAMPLE = 5
+
 @node_funcs.add_functions_as_methods(node_funcs.functions)
 class SensorNode(polyinterface.Node):
     # class variables
@@ -29,6 +41,9 @@ class SensorNode(polyinterface.Node):
         self.host = ''
         self.headers = ''
         self.configured = False;
+        self.raw = collections.deque(maxlen=RAW_HISTORY)
+        self.log_limit = node_funcs.LogLimiter(interval=SUMMARY_INTERVAL)
+        self.error_limit = node_funcs.LogLimiter(sample=ERROR_SAMPLE)
         self.uom = {
                 'CLITEMP' : 17,
                 'CLIHUM' : 22,
@@ -99,7 +114,7 @@ class SensorNode(polyinterface.Node):
                 if pm25 >= breakpoints[bpi][0] and pm25 <= breakpoints[bpi][1]:
                     break
         except Exception as e:
-            LOGGER.error('AQI_bp: ' + str(e))
+            LOGGER.error('AQI_bp: %s', e)
         
         if bpi == 6:
             LOGGER.error('AQI out of range!')
@@ -108,9 +123,9 @@ class SensorNode(polyinterface.Node):
         try:
             aqi = ((indexes[bpi][1] - indexes[bpi][0]) / (breakpoints[bpi][1] - breakpoints[bpi][0])) * (pm25 - breakpoints[bpi][0]) + indexes[bpi][0]
         except Exception as e:
-            LOGGER.error('AQI_calc: ' + str(e))
+            LOGGER.error('AQI_calc: %s', e)
 
-        LOGGER.debug('Calculated AQI = ' + str(aqi))
+        LOGGER.debug('Calculated AQI = %s', aqi)
         return (round(aqi, 0), indexes[bpi][0])
 
     def calculate_confidence(self, results):
@@ -136,12 +151,18 @@ class SensorNode(polyinterface.Node):
             return 0
 
 
+    # Return the buffered raw responses, oldest first.  shortPoll may
+    # be appending from another thread so work from a copy.
+    def dump_raw(self):
+        raw = list(self.raw)
+        return [{'time': t, 'response': r} for (t, r) in raw]
+
     def shortPoll(self):
         # Query for the current air quality conditions. We can do this fairly
         # frequently, probably as often as once a minute.
 
         if not self.configured:
-            LOGGER.info('Skipping connection because we aren\'t configured yet.')
+            self.log_limit.log(logging.INFO, 'configured', 'Skipping connection because we aren\'t configured yet.')
             return
 
 
@@ -150,32 +171,42 @@ class SensorNode(polyinterface.Node):
             try:
                 jdata = c.json()
             except:
-                LOGGER.error('Connection issue: ' + str(c))
+                self.raw.append((time.time(), c.text))
+                self.error_limit.log(logging.ERROR, 'connection', 'Connection issue: %s', c)
                 c.close()
                 return
 
             c.close()
-            LOGGER.debug(jdata)
+            self.raw.append((time.time(), jdata))
+            LOGGER.debug('%s raw response: %s', self.name, jdata)
 
             if jdata == None:
-                LOGGER.error('Current condition query returned no data')
+                self.error_limit.log(logging.ERROR, 'nodata', 'Current condition query returned no data')
                 return
 
             sensor = jdata['sensor']
 
-            if 'name' in sensor:
-                LOGGER.info('Air Quality data for ' + sensor['name'])
-            if 'model' in sensor:
-                LOGGER.info('Air Quality sensor type ' + sensor['model'])
-
             if 'pm2.5' in sensor:
                 self.update_driver('GV0', sensor['pm2.5'])
                 (aqi, idx) = self.epa_aqi(float(sensor['pm2.5']))
                 self.update_driver('GV10', aqi)
                 self.update_driver('GV11', idx)
 
+            # Only include the fields this response actually has
+            fmt = 'Air Quality data for %s'
+            args = [sensor.get('name', self.name)]
+            if 'model' in sensor:
+                fmt += ' (%s)'
+                args.append(sensor['model'])
+            if 'pm2.5' in sensor:
+                fmt += ', PM2.5 = %s, AQI = %s'
+                args += [sensor['pm2.5'], aqi]
+            if 'confidence' in sensor:
+                fmt += ', confidence = %s%%'
+                args.append(sensor['confidence'])
+            self.log_limit.log(logging.INFO, 'summary', fmt, *args)
+
             if 'confidence' in sensor:
-                LOGGER.info('Data confidence level = ' + str(sensor['confidence']) + '%')
                 self.update_driver('GV12', sensor['confidence'])
             if 'temperature' in sensor:
                 self.update_driver('CLITEMP', sensor['temperature'])
@@ -205,7 +236,10 @@ class SensorNode(polyinterface.Node):
                 if 'pm2.5_1week' in stats:
                     self.update_driver('GV8', stats['pm2.5_1week'])
 
+            # Poll succeeded, the next error starts a new fault
+            for key in ('connection', 'nodata', 'update'):
+                self.error_limit.reset(key)
+
         except Exception as e:
-            LOGGER.error('Current observation update failure')
-            LOGGER.error(e)
+            self.error_limit.log(logging.ERROR, 'update', 'Current observation update failure: %s', e)
 